@@ -10,9 +10,10 @@ import pytz
 import numpy as np
 import pandas as pd
 from abc import ABC
+from functools import lru_cache
 from datetime import date as Date
 from datetime import datetime as Datetime
-from datetime import timezone as Timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from finance.variables import Querys, Variables
 from webscraping.webpages import WebJSONPage
@@ -27,11 +28,16 @@ __copyright__ = "Copyright 2023, Jack Kirby Cook"
 __license__ = "MIT License"
 
 
-timestamp_parser = lambda integer: Datetime.fromtimestamp(integer, Timezone.utc).astimezone(pytz.timezone("US/Central"))
-current_parser = lambda integer: np.datetime64(timestamp_parser(integer))
+try: central_timezone = ZoneInfo("America/Chicago")
+except ZoneInfoNotFoundError: central_timezone = pytz.timezone("America/Chicago")
+current_parser = lambda integer: np.datetime64(int(integer), "s")
 contract_parser = lambda string: Querys.Contract.fromOSI(str(string).replace("---", ""))
 strike_parser = lambda content: np.round(content, 2).astype(np.float32)
-expire_parser = lambda string: contract_parser(string).expire
+expire_parser = lru_cache(maxsize=4096)(lambda string: contract_parser(string).expire)
+symbol_columns = list(Querys.Symbol)
+contract_columns = list(Querys.Contract)
+option_category = pd.CategoricalDtype(list(Variables.Securities.Option))
+quote_limit = 25
 
 
 class ETradeURL(WebURL, domain="https://api.etrade.com"): pass
@@ -50,7 +56,7 @@ class ETradeStockURL(ETradeURL, path=["v1", "market", "quote"]):
 
 class ETradeOptionURL(ETradeURL, path=["v1", "market", "optionchains" + ".json"]):
     @staticmethod
-    def expires(*args, expire, **kwargs): return {"expiryYear": f"{expire.year:04.0f}", "expiryMonth": f"{expire.month:02.0f}", "expiryDay": f"{expire.day:02.0f}", "expiryType": "ALL"}
+    def expires(*args, expire, **kwargs): return {"expiryYear": f"{expire.year:04d}", "expiryMonth": f"{expire.month:02d}", "expiryDay": f"{expire.day:02d}", "expiryType": "ALL"}
     @staticmethod
     def strikes(*args, strike, **kwargs): return {"strikePriceNear": str(int(strike)), "noOfStrikes": "1000", "priceType": "ALL"}
     @staticmethod
@@ -102,14 +108,6 @@ class ETradeOptionData(WebJSON, ABC):
     class Option(WebJSON.Text, locator="//optionType", key="option", parser=Variables.Securities.Option): pass
     class Current(WebJSON.Text, locator="//timeStamp", key="current", parser=current_parser): pass
 
-    def execute(self, *args, **kwargs):
-        contents = super().execute(*args, **kwargs)
-        assert isinstance(contents, dict)
-        options = pd.DataFrame.from_records([contents])
-        function = lambda column: np.round(column, 2)
-        options["strike"] = options["strike"].apply(function).astype(np.float32)
-        return options
-
 class ETradeOptionTradeData(ETradeOptionData):
     class Price(WebJSON.Text, locator="//lastPrice", key="price", parser=np.float32): pass
 
@@ -124,8 +122,8 @@ class ETradeOptionsData(WebJSON, locator="//OptionChainResponse/OptionPair[]", m
     def execute(self, *args, **kwargs):
         contents = super().execute(*args, **kwargs)
         assert isinstance(contents, dict)
-        options = list(contents.values())
-        options = pd.concat(options, axis=0)
+        options = pd.DataFrame.from_records(list(contents.values()))
+        options["strike"] = options["strike"].astype(np.float32)
         return options
 
 class ETradeOptionsTradeData(ETradeOptionsData):
@@ -139,31 +137,39 @@ class ETradeOptionsQuoteData(ETradeOptionsData):
 
 class ETradeExpirePage(WebJSONPage, url=ETradeExpireURL, data=ETradeExpireData): pass
 class ETradeStockPage(WebJSONPage, url=ETradeStockURL, data=[ETradeStockTradeData, ETradeStockQuoteData]): pass
-class ETradeOptionPage(WebJSONPage, url=ETradeOptionURL, data=[ETradeOptionsTradeData, ETradeOptionQuoteData]): pass
+class ETradeOptionPage(WebJSONPage, url=ETradeOptionURL, data=[ETradeOptionsTradeData, ETradeOptionsQuoteData]): pass
 
 
 class ETradeSettlementDownloader(Logging, title="Downloaded"):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__page = ETradeExpirePage(*args, **kwargs)
+        self.__cache = dict()
 
     def execute(self, symbols, *args, expires, **kwargs):
         assert isinstance(symbols, (list, Querys.Symbol))
         assert all([isinstance(symbol, Querys.Symbol) for symbol in symbols]) if isinstance(symbols, list) else True
         symbols = list(symbols) if isinstance(symbols, list) else [symbols]
+        expires = frozenset(expires) if isinstance(expires, (list, tuple, set)) else expires
+        if isinstance(expires, frozenset) and not bool(expires): return
         for symbol in list(symbols):
-            expires = [expire for expire in self.download(symbol, *args, **kwargs) if expire in expires]
-            settlements = [Querys.Settlement(symbol.ticker, expire) for expire in expires]
+            settlements = [Querys.Settlement(symbol.ticker, expire) for expire in self.download(symbol, *args, **kwargs) if expire in expires]
             self.console(f"{str(symbol)}[{len(settlements):.0f}]")
             if not bool(settlements): continue
             yield settlements
 
     def download(self, symbol, *args, **kwargs):
+        current = Datetime.now(central_timezone).date()
+        cached, expires = self.cache.get(symbol.ticker, (None, None))
+        if cached == current: return expires
         parameters = dict(ticker=symbol.ticker)
         expires = self.page(*args, **parameters, **kwargs)
         assert isinstance(expires, list)
+        if bool(expires): self.cache[symbol.ticker] = (current, expires)
         return expires
 
+    @property
+    def cache(self): return self.__cache
     @property
     def page(self): return self.__page
 
@@ -177,18 +183,24 @@ class ETradeStockDownloader(Sizing, Emptying, Logging, title="Downloaded"):
         assert isinstance(symbols, (list, Querys.Symbol))
         assert all([isinstance(symbol, Querys.Symbol) for symbol in symbols]) if isinstance(symbols, list) else True
         symbols = list(symbols) if isinstance(symbols, list) else [symbols]
-        for symbol in list(symbols):
-            stocks = self.download(symbol, *args, **kwargs)
-            size = self.size(stocks)
-            self.console(f"{str(symbol)}[{int(size):.0f}]")
-            if self.empty(stocks): return
-            return stocks
+        batches = [symbols[index:index + quote_limit] for index in range(0, len(symbols), quote_limit)]
+        stocks = []
+        for batch in list(batches):
+            downloaded = self.download(batch, *args, **kwargs)
+            for symbol in list(batch):
+                size = self.size(downloaded[downloaded["ticker"] == symbol.ticker])
+                self.console(f"{str(symbol)}[{int(size):.0f}]")
+            if self.empty(downloaded): continue
+            stocks.append(downloaded)
+        if not bool(stocks): return
+        stocks = pd.concat(stocks, axis=0, ignore_index=True) if len(stocks) > 1 else stocks[0]
+        return stocks
 
-    def download(self, symbol, *args, **kwargs):
-        parameters = dict(ticker=symbol.ticker)
+    def download(self, symbols, *args, **kwargs):
+        parameters = dict(ticker=[symbol.ticker for symbol in symbols])
         trade, quote = self.page(*args, **parameters, **kwargs)
         assert isinstance(trade, pd.DataFrame) and isinstance(quote, pd.DataFrame)
-        stocks = trade.merge(quote, how="outer", on=list(Querys.Symbol), sort=False, suffixes=("", "_"))
+        stocks = trade.merge(quote, how="outer", on=symbol_columns, sort=False, suffixes=("", "_"))
         return stocks
 
     @property
@@ -204,20 +216,25 @@ class ETradeOptionDownloader(Sizing, Emptying, Logging, title="Downloaded"):
         assert isinstance(settlements, (list, Querys.Settlement))
         assert all([isinstance(settlement, Querys.Settlement) for settlement in settlements]) if isinstance(settlements, list) else True
         settlements = list(settlements) if isinstance(settlements, list) else [settlements]
+        options = []
         for settlement in list(settlements):
-            options = self.download(settlement, *args, **kwargs)
-            size = self.size(options)
+            downloaded = self.download(settlement, *args, **kwargs)
+            size = self.size(downloaded)
             self.console(f"{str(settlement)}[{int(size):.0f}]")
-            if self.empty(options): return
-            return options
+            if self.empty(downloaded): continue
+            options.append(downloaded)
+        if not bool(options): return
+        options = pd.concat(options, axis=0, ignore_index=True) if len(options) > 1 else options[0]
+        return options
 
     def download(self, settlement, *args, underlying={}, **kwargs):
         assert isinstance(underlying, dict)
         parameters = dict(ticker=settlement.ticker, expire=settlement.expire, strike=underlying[settlement.ticker])
         trade, quote = self.page(*args, **parameters, **kwargs)
         assert isinstance(trade, pd.DataFrame) and isinstance(quote, pd.DataFrame)
-        options = trade.merge(quote, how="outer", on=list(Querys.Contract), sort=False, suffixes=("", "_"))
+        options = trade.merge(quote, how="outer", on=contract_columns, sort=False, suffixes=("", "_"))
         options["underlying"] = underlying[settlement.ticker]
+        options["option"] = options["option"].astype(option_category)
         return options
 
     @property